@@ -6,6 +6,7 @@ others.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import logging
 from typing import Any, Final
@@ -98,6 +99,63 @@ SET_ZONE_OVERRIDE_SCHEMA: Final = vol.Schema(
 )
 
 
+def _system_mode_schema(modes: list[dict[str, Any]]) -> vol.Schema | None:
+    """Return the service schema for the system's allowed system modes, if any."""
+
+    perm_modes: list[str] = []  # any of: "Auto", "HeatingOff": permanent only
+    hour_modes: list[str] = []  # any of: "AutoWithEco", permanent or for 0-24 hours
+    days_modes: list[str] = []  # any of: "Away", "Custom", "DayOff", or 1-99 days
+
+    for m in modes:
+        if (mode := m[SZ_SYSTEM_MODE]) == SZ_AUTO_WITH_RESET:
+            continue  # this mode has its own service, if supported
+        if not m[SZ_CAN_BE_TEMPORARY]:
+            perm_modes.append(mode)
+        elif m[SZ_TIMING_MODE] == "Duration":
+            hour_modes.append(mode)
+        elif m[SZ_TIMING_MODE] == "Period":
+            days_modes.append(mode)
+
+    if not (all_modes := perm_modes + hour_modes + days_modes):
+        return None
+
+    def validate_duration(data: dict[str, Any]) -> dict[str, Any]:
+        """Check a duration (if any) is valid for the mode, per its timing mode."""
+        # Permanent-only modes have no duration, some modes are set for a number of
+        # hours (0-24), and others for a number of days (1-99)
+        if ATTR_DURATION_HOURS in data and data[ATTR_SYSTEM_MODE] not in hour_modes:
+            raise vol.Invalid(
+                f"'{ATTR_DURATION_HOURS}' is not valid for mode: "
+                f"{data[ATTR_SYSTEM_MODE]}"
+            )
+        if ATTR_DURATION_DAYS in data and data[ATTR_SYSTEM_MODE] not in days_modes:
+            raise vol.Invalid(
+                f"'{ATTR_DURATION_DAYS}' is not valid for mode: "
+                f"{data[ATTR_SYSTEM_MODE]}"
+            )
+        return data
+
+    # All modes share one schema (rather than trying a schema per timing mode)
+    return vol.Schema(
+        vol.All(
+            vol.Schema(
+                {
+                    vol.Required(ATTR_SYSTEM_MODE): vol.In(all_modes),
+                    vol.Optional(ATTR_DURATION_HOURS): vol.All(
+                        cv.time_period,
+                        vol.Range(min=timedelta(hours=0), max=timedelta(hours=24)),
+                    ),
+                    vol.Optional(ATTR_DURATION_DAYS): vol.All(
+                        cv.time_period,
+                        vol.Range(min=timedelta(days=1), max=timedelta(days=99)),
+                    ),
+                }
+            ),
+            validate_duration,
+        )
+    )
+
+
 class EvoSession:
     """Class for evohome client instantiation & authentication."""
 
@@ -108,6 +166,8 @@ class EvoSession:
 
         self._session = async_get_clientsession(hass)
         self._store = Store[dict[str, Any]](hass, STORAGE_VER, STORAGE_KEY)
+        self._store_lock = asyncio.Lock()  # the v1/v2 APIs may save concurrently
+        self._saved_tokens: tuple[str | None, ...] | None = None  # as last stored
 
         # the main client, which uses the newer API
         self.client_v2: evo.EvohomeClient | None = None
@@ -159,11 +219,13 @@ class EvoSession:
         Sets self._tokens and self._session_id to the latest values.
         """
 
-        app_storage: dict[str, Any] = dict(await self._store.async_load() or {})
+        # Store.async_load() returns a copy, so it is safe to modify it here
+        app_storage: dict[str, Any] = await self._store.async_load() or {}
 
         if app_storage.pop(CONF_USERNAME, None) != username:
             # any tokens won't be valid, and store might be corrupt
             await self._store.async_save({})
+            self._saved_tokens = None
 
             self.session_id = None
             self._tokens = {}
@@ -187,29 +249,46 @@ class EvoSession:
         Sets self._tokens and self._session_id to the latest values.
         """
 
+        async with self._store_lock:
+            await self._save_auth_tokens()
+
+    async def _save_auth_tokens(self) -> None:
+        """Save access tokens and session_id to the store (the lock is held)."""
+
         if self.client_v2 is None:
             await self._store.async_save({})
+            self._saved_tokens = None
             return
 
-        # evohomeasync2 uses naive/local datetimes
-        access_token_expires = dt_local_to_aware(
-            self.client_v2.access_token_expires  # type: ignore[arg-type]
+        self.session_id = self.client_v1.broker.session_id if self.client_v1 else None
+
+        # the access token (and its expiry) will usually be unchanged since last time
+        saved_tokens = (
+            self.client_v2.username,
+            self.client_v2.refresh_token,
+            self.client_v2.access_token,
+            self.session_id,
         )
+        if saved_tokens == self._saved_tokens:
+            return  # the store is already up to date
+
+        # evohomeasync2 uses naive/local datetimes
+        expires = self.client_v2.access_token_expires
+        assert expires is not None  # mypy check
 
         self._tokens = {
             CONF_USERNAME: self.client_v2.username,
             REFRESH_TOKEN: self.client_v2.refresh_token,
             ACCESS_TOKEN: self.client_v2.access_token,
-            ACCESS_TOKEN_EXPIRES: access_token_expires.isoformat(),
+            ACCESS_TOKEN_EXPIRES: dt_local_to_aware(expires).isoformat(),
         }
 
-        self.session_id = self.client_v1.broker.session_id if self.client_v1 else None
-
         app_storage = self._tokens
         if self.client_v1:
             app_storage[USER_DATA] = {SZ_SESSION_ID: self.session_id}
 
         await self._store.async_save(app_storage)
+        self._saved_tokens = saved_tokens
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -248,8 +327,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     hass.data[DOMAIN] = {"broker": broker, "coordinator": coordinator}
 
-    # without a listener, _schedule_refresh() won't be invoked by _async_refresh()
-    coordinator.async_add_listener(lambda: None)
+    # the entities are CoordinatorEntity's, so their listeners schedule the refreshes
     await coordinator.async_refresh()  # get initial state
 
     hass.async_create_task(
@@ -279,24 +357,24 @@ def setup_service_functions(hass: HomeAssistant, broker: EvoBroker) -> None:
     @verify_domain_control(hass, DOMAIN)
     async def force_refresh(call: ServiceCall) -> None:
         """Obtain the latest state data via the vendor's RESTful API."""
-        await broker.async_update()
+        await hass.data[DOMAIN]["coordinator"].async_request_refresh()
 
     @verify_domain_control(hass, DOMAIN)
     async def set_system_mode(call: ServiceCall) -> None:
         """Set the system mode."""
         payload = {
-            "unique_id": broker.tcs.systemId,
             "service": call.service,
             "data": call.data,
         }
-        async_dispatcher_send(hass, DOMAIN, payload)
+        async_dispatcher_send(hass, f"{DOMAIN}_{broker.tcs.systemId}", payload)
+
+    registry = er.async_get(hass)  # is a singleton, so can be cached here
 
     @verify_domain_control(hass, DOMAIN)
     async def set_zone_override(call: ServiceCall) -> None:
         """Set the zone override (setpoint)."""
         entity_id = call.data[ATTR_ENTITY_ID]
 
-        registry = er.async_get(hass)
         registry_entry = registry.async_get(entity_id)
 
         if registry_entry is None or registry_entry.platform != DOMAIN:
@@ -306,12 +384,11 @@ def setup_service_functions(hass: HomeAssistant, broker: EvoBroker) -> None:
             raise ValueError(f"'{entity_id}' is not an {DOMAIN} controller/zone")
 
         payload = {
-            "unique_id": registry_entry.unique_id,
             "service": call.service,
             "data": call.data,
         }
 
-        async_dispatcher_send(hass, DOMAIN, payload)
+        async_dispatcher_send(hass, f"{DOMAIN}_{registry_entry.unique_id}", payload)
 
     hass.services.async_register(DOMAIN, EvoService.REFRESH_SYSTEM, force_refresh)
 
@@ -319,54 +396,15 @@ def setup_service_functions(hass: HomeAssistant, broker: EvoBroker) -> None:
     modes = broker.tcs.allowedSystemModes
 
     # Not all systems support "AutoWithReset": register this handler only if required
-    if [m[SZ_SYSTEM_MODE] for m in modes if m[SZ_SYSTEM_MODE] == SZ_AUTO_WITH_RESET]:
+    if any(m[SZ_SYSTEM_MODE] == SZ_AUTO_WITH_RESET for m in modes):
         hass.services.async_register(DOMAIN, EvoService.RESET_SYSTEM, set_system_mode)
 
-    system_mode_schemas = []
-    modes = [m for m in modes if m[SZ_SYSTEM_MODE] != SZ_AUTO_WITH_RESET]
-
-    # Permanent-only modes will use this schema
-    perm_modes = [m[SZ_SYSTEM_MODE] for m in modes if not m[SZ_CAN_BE_TEMPORARY]]
-    if perm_modes:  # any of: "Auto", "HeatingOff": permanent only
-        schema = vol.Schema({vol.Required(ATTR_SYSTEM_MODE): vol.In(perm_modes)})
-        system_mode_schemas.append(schema)
-
-    modes = [m for m in modes if m[SZ_CAN_BE_TEMPORARY]]
-
-    # These modes are set for a number of hours (or indefinitely): use this schema
-    temp_modes = [m[SZ_SYSTEM_MODE] for m in modes if m[SZ_TIMING_MODE] == "Duration"]
-    if temp_modes:  # any of: "AutoWithEco", permanent or for 0-24 hours
-        schema = vol.Schema(
-            {
-                vol.Required(ATTR_SYSTEM_MODE): vol.In(temp_modes),
-                vol.Optional(ATTR_DURATION_HOURS): vol.All(
-                    cv.time_period,
-                    vol.Range(min=timedelta(hours=0), max=timedelta(hours=24)),
-                ),
-            }
-        )
-        system_mode_schemas.append(schema)
-
-    # These modes are set for a number of days (or indefinitely): use this schema
-    temp_modes = [m[SZ_SYSTEM_MODE] for m in modes if m[SZ_TIMING_MODE] == "Period"]
-    if temp_modes:  # any of: "Away", "Custom", "DayOff", permanent or for 1-99 days
-        schema = vol.Schema(
-            {
-                vol.Required(ATTR_SYSTEM_MODE): vol.In(temp_modes),
-                vol.Optional(ATTR_DURATION_DAYS): vol.All(
-                    cv.time_period,
-                    vol.Range(min=timedelta(days=1), max=timedelta(days=99)),
-                ),
-            }
-        )
-        system_mode_schemas.append(schema)
-
-    if system_mode_schemas:
+    if (schema := _system_mode_schema(modes)) is not None:
         hass.services.async_register(
             DOMAIN,
             EvoService.SET_SYSTEM_MODE,
             set_system_mode,
-            schema=vol.Schema(vol.Any(*system_mode_schemas)),
+            schema=schema,
         )
 
     # The zone modes are consistent across all systems and use the same schema
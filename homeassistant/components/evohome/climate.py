@@ -34,6 +34,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 import homeassistant.util.dt as dt_util
 
 from .const import (
@@ -105,6 +106,7 @@ async def async_setup_platform(
         return
 
     broker: EvoBroker = hass.data[DOMAIN]["broker"]
+    coordinator: DataUpdateCoordinator[None] = hass.data[DOMAIN]["coordinator"]
 
     _LOGGER.debug(
         "Found the Location/Controller (%s), id=%s, name=%s (location_idx=%s)",
@@ -114,7 +116,7 @@ async def async_setup_platform(
         broker.loc_idx,
     )
 
-    entities: list[EvoClimateEntity] = [EvoController(broker, broker.tcs)]
+    entities: list[EvoClimateEntity] = [EvoController(coordinator, broker, broker.tcs)]
 
     for zone in broker.tcs.zones.values():
         if (
@@ -129,7 +131,7 @@ async def async_setup_platform(
                 zone.name,
             )
 
-            new_entity = EvoZone(broker, zone)
+            new_entity = EvoZone(coordinator, broker, zone)
             entities.append(new_entity)
 
         else:
@@ -166,10 +168,15 @@ class EvoZone(EvoChild, EvoClimateEntity):
 
     _evo_device: evo.Zone  # mypy hint
 
-    def __init__(self, evo_broker: EvoBroker, evo_device: evo.Zone) -> None:
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator[None],
+        evo_broker: EvoBroker,
+        evo_device: evo.Zone,
+    ) -> None:
         """Initialize an evohome-compatible heating zone."""
 
-        super().__init__(evo_broker, evo_device)
+        super().__init__(coordinator, evo_broker, evo_device)
         self._evo_id = evo_device.zoneId
 
         if evo_device.modelType.startswith("VisionProWifi"):
@@ -356,10 +363,15 @@ class EvoController(EvoClimateEntity):
 
     _evo_device: evo.ControlSystem  # mypy hint
 
-    def __init__(self, evo_broker: EvoBroker, evo_device: evo.ControlSystem) -> None:
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator[None],
+        evo_broker: EvoBroker,
+        evo_device: evo.ControlSystem,
+    ) -> None:
         """Initialize an evohome-compatible controller."""
 
-        super().__init__(evo_broker, evo_device)
+        super().__init__(coordinator, evo_broker, evo_device)
         self._evo_id = evo_device.systemId
 
         self._attr_unique_id = evo_device.systemId
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable
-from datetime import timedelta
+from datetime import timedelta, timezone
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -18,8 +19,6 @@ from evohomeasync2.schema.const import (
     SZ_TIME_ZONE,
 )
 
-from homeassistant.helpers.dispatcher import async_dispatcher_send
-
 from .const import CONF_LOCATION_IDX, DOMAIN, GWS, TCS, UTC_OFFSET
 from .helpers import handle_evo_exception
 
@@ -35,6 +34,7 @@ class EvoBroker:
     loc_idx: int
     loc: evo.Location
     loc_utc_offset: timedelta
+    loc_tz: timezone  # a fixed offset, as per loc_utc_offset
     tcs: evo.ControlSystem
 
     def __init__(self, sess: EvoSession) -> None:
@@ -73,16 +73,20 @@ class EvoBroker:
 
         self.loc = self.client.locations[loc_idx]
         self.loc_utc_offset = timedelta(minutes=self.loc.timeZone[UTC_OFFSET])
+        self.loc_tz = timezone(self.loc_utc_offset)
         self.tcs = self.loc._gateways[0]._control_systems[0]  # noqa: SLF001
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
+            loc_data = loc_config[SZ_LOCATION_INFO]
+            gwy_data = loc_config[GWS][0]
+
             loc_info = {
-                SZ_LOCATION_ID: loc_config[SZ_LOCATION_INFO][SZ_LOCATION_ID],
-                SZ_TIME_ZONE: loc_config[SZ_LOCATION_INFO][SZ_TIME_ZONE],
+                SZ_LOCATION_ID: loc_data[SZ_LOCATION_ID],
+                SZ_TIME_ZONE: loc_data[SZ_TIME_ZONE],
             }
             gwy_info = {
-                SZ_GATEWAY_ID: loc_config[GWS][0][SZ_GATEWAY_INFO][SZ_GATEWAY_ID],
-                TCS: loc_config[GWS][0][TCS],
+                SZ_GATEWAY_ID: gwy_data[SZ_GATEWAY_INFO][SZ_GATEWAY_ID],
+                TCS: gwy_data[TCS],
             }
             config = {
                 SZ_LOCATION_INFO: loc_info,
@@ -175,7 +179,6 @@ class EvoBroker:
         except evo.RequestFailed as err:
             handle_evo_exception(err)
         else:
-            async_dispatcher_send(self.hass, DOMAIN)
             _LOGGER.debug("Status = %s", status)
         finally:
             if access_token != self.client.access_token:
@@ -187,8 +190,28 @@ class EvoBroker:
         This includes state data for a Controller and all its child devices, such as the
         operating mode of the Controller and the current temp of its children (e.g.
         Zones, DHW controller).
+
+        The (independent) v2 and v1 APIs are called concurrently.
         """
-        await self._update_v2_api_state()
 
-        if self.client_v1:
-            await self._update_v1_api_temps()
+        if self.client_v1 is None:
+            await self._update_v2_api_state()
+            return
+
+        v2_result, v1_result = await asyncio.gather(
+            self._update_v2_api_state(),
+            self._update_v1_api_temps(),
+            return_exceptions=True,
+        )
+
+        if isinstance(v2_result, BaseException):
+            raise v2_result
+
+        # the high-precision temps are best-effort (they will have been reset)
+        if isinstance(v1_result, Exception):
+            _LOGGER.warning(
+                "Unable to obtain the latest high-precision temperatures",
+                exc_info=v1_result,
+            )
+        elif isinstance(v1_result, BaseException):  # e.g. asyncio.CancelledError
+            raise v1_result
@@ -1,6 +1,7 @@
 """Base for evohome entity."""
 
-from datetime import datetime, timedelta, timezone
+from bisect import bisect_left
+from datetime import date, datetime, time, timedelta
 import logging
 from typing import Any
 
@@ -14,8 +15,12 @@ from evohomeasync2.schema.const import (
     SZ_UNTIL,
 )
 
+from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
 import homeassistant.util.dt as dt_util
 
 from . import EvoBroker, EvoService
@@ -25,34 +30,30 @@ from .helpers import convert_dict, convert_until
 _LOGGER = logging.getLogger(__name__)
 
 
-class EvoDevice(Entity):
+class EvoDevice(CoordinatorEntity[DataUpdateCoordinator[None]]):
     """Base for any evohome-compatible entity (controller, DHW, zone).
 
     This includes the controller, (1 to 12) heating zones and (optionally) a
     DHW controller.
     """
 
-    _attr_should_poll = False
-
     def __init__(
         self,
+        coordinator: DataUpdateCoordinator[None],
         evo_broker: EvoBroker,
         evo_device: evo.ControlSystem | evo.HotWater | evo.Zone,
     ) -> None:
         """Initialize an evohome-compatible entity (TCS, DHW, zone)."""
+        super().__init__(coordinator)
+
         self._evo_device = evo_device
         self._evo_broker = evo_broker
         self._evo_tcs = evo_broker.tcs
 
         self._device_state_attrs: dict[str, Any] = {}
 
-    async def async_refresh(self, payload: dict | None = None) -> None:
-        """Process any signals."""
-        if payload is None:
-            self.async_schedule_update_ha_state(force_refresh=True)
-            return
-        if payload["unique_id"] != self._attr_unique_id:
-            return
+    async def async_refresh(self, payload: dict) -> None:
+        """Process a service request signalled to this entity."""
         if payload["service"] in (
             EvoService.SET_ZONE_OVERRIDE,
             EvoService.RESET_ZONE_OVERRIDE,
@@ -82,9 +83,28 @@ class EvoDevice(Entity):
 
         return {"status": convert_dict(status)}
 
+    @property
+    def available(self) -> bool:
+        """Return True, as the entity remains available if a poll fails.
+
+        This overrides CoordinatorEntity, which ties availability to the last update.
+        """
+        return self._attr_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self.async_schedule_update_ha_state(force_refresh=True)
+
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
-        async_dispatcher_connect(self.hass, DOMAIN, self.async_refresh)
+        await super().async_added_to_hass()
+
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, f"{DOMAIN}_{self._attr_unique_id}", self.async_refresh
+            )
+        )
 
 
 class EvoChild(EvoDevice):
@@ -96,13 +116,22 @@ class EvoChild(EvoDevice):
     _evo_id: str  # mypy hint
 
     def __init__(
-        self, evo_broker: EvoBroker, evo_device: evo.HotWater | evo.Zone
+        self,
+        coordinator: DataUpdateCoordinator[None],
+        evo_broker: EvoBroker,
+        evo_device: evo.HotWater | evo.Zone,
     ) -> None:
         """Initialize an evohome-compatible child entity (DHW, zone)."""
-        super().__init__(evo_broker, evo_device)
+        super().__init__(coordinator, evo_broker, evo_device)
 
         self._schedule: dict[str, Any] = {}
+        self._schedule_version = 0  # incremented whenever the schedule is updated
+        self._daily_schedules: list[dict[str, Any]] = []  # Monday is 0
+        self._switchpoint_times: list[list[time]] = []  # TimeOfDay, for each day
         self._setpoints: dict[str, Any] = {}
+        self._next_sp_ts = 0.0  # timestamp of next_sp_from, if any
+        self._setpoints_cache_key: tuple[int, date, int] | None = None
+        self._loc_tz = evo_broker.loc_tz  # the TZ of the TCS location (it is fixed)
 
     @property
     def current_temperature(self) -> float | None:
@@ -122,27 +151,26 @@ class EvoChild(EvoDevice):
         Only Zones & DHW controllers (but not the TCS) can have schedules.
         """
 
-        def _dt_evo_to_aware(dt_naive: datetime, utc_offset: timedelta) -> datetime:
-            dt_aware = dt_naive.replace(tzinfo=dt_util.UTC) - utc_offset
-            return dt_util.as_local(dt_aware)
-
-        if not (schedule := self._schedule.get("DailySchedules")):
+        if not (schedule := self._daily_schedules):
             return {}  # no scheduled setpoints when {'DailySchedules': []}
 
         # get dt in the same TZ as the TCS location, so we can compare schedule times
-        day_time = dt_util.now().astimezone(timezone(self._evo_broker.loc_utc_offset))
-        day_of_week = day_time.weekday()  # for evohome, 0 is Monday
-        time_of_day = day_time.strftime("%H:%M:%S")
+        day_time = dt_util.now().astimezone(self._loc_tz)
+        today = day_time.date()
+        day_of_week = today.weekday()  # for evohome, 0 is Monday
+        time_of_day = day_time.time().replace(microsecond=0)
 
         try:
-            # Iterate today's switchpoints until past the current time of day...
+            # Find the last of today's switchpoints before the current time of day, if
+            # any, else -1 (the last switchpoint of the day before)...
             day = schedule[day_of_week]
-            sp_idx = -1  # last switchpoint of the day before
-            for i, tmp in enumerate(day["Switchpoints"]):
-                if time_of_day > tmp["TimeOfDay"]:
-                    sp_idx = i  # current setpoint
-                else:
-                    break
+            sp_idx = bisect_left(self._switchpoint_times[day_of_week], time_of_day) - 1
+
+            # The setpoints only change when the schedule, or the current switchpoint,
+            # changes, so there is no need to recalculate them until then
+            cache_key = (self._schedule_version, today, sp_idx)
+            if cache_key == self._setpoints_cache_key:
+                return self._setpoints
 
             # Did this setpoint start yesterday? Does the next setpoint start tomorrow?
             this_sp_day = -1 if sp_idx == -1 else 0
@@ -152,26 +180,31 @@ class EvoChild(EvoDevice):
                 ("this", this_sp_day, sp_idx),
                 ("next", next_sp_day, (sp_idx + 1) * (1 - next_sp_day)),
             ):
-                sp_date = (day_time + timedelta(days=offset)).strftime("%Y-%m-%d")
+                sp_date = today + timedelta(days=offset) if offset else today
                 day = schedule[(day_of_week + offset) % 7]
                 switchpoint = day["Switchpoints"][idx]
 
-                switchpoint_time_of_day = dt_util.parse_datetime(
-                    f"{sp_date}T{switchpoint['TimeOfDay']}"
-                )
-                assert switchpoint_time_of_day is not None  # mypy check
-                dt_aware = _dt_evo_to_aware(
-                    switchpoint_time_of_day, self._evo_broker.loc_utc_offset
+                switchpoint_time_of_day = datetime.combine(
+                    sp_date,
+                    self._switchpoint_times[(day_of_week + offset) % 7][idx],
+                    tzinfo=self._loc_tz,
                 )
+                dt_aware = dt_util.as_local(switchpoint_time_of_day)
 
                 self._setpoints[f"{key}_sp_from"] = dt_aware.isoformat()
+                if key == "next":
+                    self._next_sp_ts = dt_aware.timestamp()
                 try:
                     self._setpoints[f"{key}_sp_temp"] = switchpoint[SZ_HEAT_SETPOINT]
                 except KeyError:
                     self._setpoints[f"{key}_sp_state"] = switchpoint["DhwState"]
 
+            self._setpoints_cache_key = cache_key
+
         except IndexError:
             self._setpoints = {}
+            self._next_sp_ts = 0.0
+            self._setpoints_cache_key = None
             _LOGGER.warning(
                 "Failed to get setpoints, report as an issue if this error persists",
                 exc_info=True,
@@ -198,13 +231,20 @@ class EvoChild(EvoDevice):
         else:
             self._schedule = schedule or {}
 
+        self._daily_schedules = self._schedule.get("DailySchedules") or []
+
+        # parse the "HH:MM:SS" strings once, they are in order, so can be bisected
+        self._switchpoint_times = [
+            [time.fromisoformat(sp["TimeOfDay"]) for sp in day["Switchpoints"]]
+            for day in self._daily_schedules
+        ]
+        self._schedule_version += 1
+
         _LOGGER.debug("Schedule['%s'] = %s", self.name, self._schedule)
 
     async def async_update(self) -> None:
         """Get the latest state data."""
-        next_sp_from = self._setpoints.get("next_sp_from", "2000-01-01T00:00:00+00:00")
-        next_sp_from_dt = dt_util.parse_datetime(next_sp_from)
-        if next_sp_from_dt is None or dt_util.now() >= next_sp_from_dt:
+        if dt_util.utcnow().timestamp() >= self._next_sp_ts:
             await self._update_schedule()  # no schedule, or it's out-of-date
 
         self._device_state_attrs = {"setpoints": self.setpoints}
@@ -29,6 +29,7 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 import homeassistant.util.dt as dt_util
 
 from .const import DOMAIN, EVO_FOLLOW, EVO_PERMOVER
@@ -59,6 +60,7 @@ async def async_setup_platform(
         return
 
     broker: EvoBroker = hass.data[DOMAIN]["broker"]
+    coordinator: DataUpdateCoordinator[None] = hass.data[DOMAIN]["coordinator"]
 
     assert broker.tcs.hotwater is not None  # mypy check
 
@@ -68,7 +70,7 @@ async def async_setup_platform(
         broker.tcs.hotwater.dhwId,
     )
 
-    new_entity = EvoDHW(broker, broker.tcs.hotwater)
+    new_entity = EvoDHW(coordinator, broker, broker.tcs.hotwater)
 
     async_add_entities([new_entity], update_before_add=True)
 
@@ -83,10 +85,15 @@ class EvoDHW(EvoChild, WaterHeaterEntity):
 
     _evo_device: evo.HotWater  # mypy hint
 
-    def __init__(self, evo_broker: EvoBroker, evo_device: evo.HotWater) -> None:
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator[None],
+        evo_broker: EvoBroker,
+        evo_device: evo.HotWater,
+    ) -> None:
         """Initialize an evohome-compatible DHW controller."""
 
-        super().__init__(evo_broker, evo_device)
+        super().__init__(coordinator, evo_broker, evo_device)
         self._evo_id = evo_device.dhwId
 
         self._attr_unique_id = evo_device.dhwId
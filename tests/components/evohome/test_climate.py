@@ -5,8 +5,10 @@ All evohome systems have controllers and at least one zone.
 
 from __future__ import annotations
 
+from typing import Any
 from unittest.mock import patch
 
+from evohomeasync2.zone import Zone
 from freezegun.api import FrozenDateTimeFactory
 import pytest
 from syrupy import SnapshotAssertion
@@ -19,6 +21,7 @@ from homeassistant.components.climate import (
     SERVICE_SET_TEMPERATURE,
     HVACMode,
 )
+from homeassistant.components.evohome import DOMAIN, EvoService
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_TEMPERATURE,
@@ -230,3 +233,124 @@ async def test_zone_turn_on(
         assert mock_fcn.await_count == 1
         assert mock_fcn.await_args.args == ()
         assert mock_fcn.await_args.kwargs == {}
+
+
+@pytest.mark.freeze_time("2024-07-10T12:00:00Z")
+@pytest.mark.parametrize("install", ["default"])
+async def test_zone_setpoints_rollover(
+    hass: HomeAssistant,
+    zone_id: str,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a zone's setpoints roll over, and its schedule is refreshed, over time."""
+
+    coordinator = hass.data[DOMAIN]["coordinator"]
+
+    assert (state := hass.states.get(zone_id)) is not None
+    zone_name = state.name
+
+    async def get_setpoints() -> dict[str, Any]:
+        """Refresh the integration and return the zone's current setpoints."""
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+        assert (state := hass.states.get(zone_id)) is not None
+        return state.attributes["status"]["setpoints"]
+
+    with patch(
+        "evohomeasync2.zone.Zone.get_schedule",
+        autospec=True,
+        side_effect=Zone.get_schedule,
+    ) as mock_fcn:
+
+        def schedule_fetches() -> int:
+            """Return the number of times this zone's schedule has been fetched."""
+            return sum(c.args[0].name == zone_name for c in mock_fcn.await_args_list)
+
+        setpoints = await get_setpoints()
+
+        assert schedule_fetches() == 0  # the schedule was fetched during setup
+        assert setpoints["this_sp_from"] == "2024-07-10T08:00:00+01:00"
+        assert setpoints["next_sp_from"] == "2024-07-10T22:10:00+01:00"
+
+        # until the next switchpoint, the setpoints & schedule are unchanged
+        freezer.move_to("2024-07-10T22:09:59+01:00")
+        assert await get_setpoints() == setpoints
+        assert schedule_fetches() == 0
+
+        # after each switchpoint, the setpoints roll over & the schedule is fetched
+        fetches = 0
+        while setpoints["next_sp_from"].startswith("2024-07-10T"):
+            freezer.move_to(setpoints["next_sp_from"])
+            freezer.tick(1)
+            next_setpoints = await get_setpoints()
+
+            fetches += 1
+            assert schedule_fetches() == fetches
+            assert next_setpoints["this_sp_from"] == setpoints["next_sp_from"]
+            setpoints = next_setpoints
+
+        # after midnight, the current setpoint is (still) the last one of yesterday
+        freezer.move_to("2024-07-11T00:00:01+01:00")
+        assert await get_setpoints() == setpoints
+        assert schedule_fetches() == fetches
+
+        # after the first switchpoint of the day, the setpoints roll over
+        freezer.move_to(setpoints["next_sp_from"])
+        freezer.tick(1)
+        next_setpoints = await get_setpoints()
+
+        assert schedule_fetches() == fetches + 1
+        assert next_setpoints["this_sp_from"] == setpoints["next_sp_from"]
+        assert next_setpoints["this_sp_from"].startswith("2024-07-11T")
+        assert next_setpoints["next_sp_from"] > next_setpoints["this_sp_from"]
+
+
+@pytest.mark.parametrize("install", ["default"])
+async def test_zone_services(
+    hass: HomeAssistant,
+    zone_id: str,
+) -> None:
+    """Test EvoService.SET/RESET_ZONE_OVERRIDE of an evohome zone Climate entity."""
+
+    assert (state := hass.states.get(zone_id)) is not None
+    zone_name = state.name
+
+    # the request is sent to the target zone only (not the controller)
+    with (
+        patch(
+            "homeassistant.components.evohome.entity.EvoDevice.async_zone_svc_request"
+        ) as mock_tcs,
+        patch("evohomeasync2.zone.Zone.reset_mode", autospec=True) as mock_fcn,
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            EvoService.RESET_ZONE_OVERRIDE,
+            {ATTR_ENTITY_ID: zone_id},
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+
+        assert mock_fcn.await_count == 1
+        assert mock_fcn.await_args.args[0].name == zone_name
+        assert mock_tcs.await_count == 0
+
+    with (
+        patch(
+            "homeassistant.components.evohome.entity.EvoDevice.async_zone_svc_request"
+        ) as mock_tcs,
+        patch("evohomeasync2.zone.Zone.set_temperature", autospec=True) as mock_fcn,
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            EvoService.SET_ZONE_OVERRIDE,
+            {ATTR_ENTITY_ID: zone_id, "setpoint": 19.5},
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+
+        assert mock_fcn.await_count == 1
+        assert mock_fcn.await_args.args[0].name == zone_name
+        assert mock_fcn.await_args.args[1:] == (19.5,)
+        assert mock_fcn.await_args.kwargs == {"until": None}
+        assert mock_tcs.await_count == 0
@@ -4,15 +4,17 @@ from __future__ import annotations
 
 from http import HTTPStatus
 import logging
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from evohomeasync2 import EvohomeClient, exceptions as exc
 from evohomeasync2.broker import _ERR_MSG_LOOKUP_AUTH, _ERR_MSG_LOOKUP_BASE
 from freezegun.api import FrozenDateTimeFactory
 import pytest
 from syrupy import SnapshotAssertion
+import voluptuous as vol
 
 from homeassistant.components.evohome import DOMAIN, EvoService
+from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 
@@ -188,3 +190,112 @@ async def test_service_reset_system(
         assert mock_fcn.await_count == 1
         assert mock_fcn.await_args.args == ("AutoWithReset",)
         assert mock_fcn.await_args.kwargs == {"until": None}
+
+
+@pytest.mark.parametrize("install", ["default"])
+async def test_service_set_system_mode(
+    hass: HomeAssistant,
+    evohome: EvohomeClient,
+) -> None:
+    """Test EvoService.SET_SYSTEM_MODE of an evohome system."""
+
+    # EvoService.SET_SYSTEM_MODE: a mode that can be set for a number of days
+    with patch("evohomeasync2.controlsystem.ControlSystem.set_mode") as mock_fcn:
+        await hass.services.async_call(
+            DOMAIN,
+            EvoService.SET_SYSTEM_MODE,
+            {"mode": "Away", "period": {"days": 21}},
+            blocking=True,
+        )
+
+        assert mock_fcn.await_count == 1
+        assert mock_fcn.await_args.args == ("Away",)
+        assert mock_fcn.await_args.kwargs["until"] is not None
+
+    # EvoService.SET_SYSTEM_MODE: a duration is not valid for a permanent-only mode
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN,
+            EvoService.SET_SYSTEM_MODE,
+            {"mode": "Auto", "duration": {"hours": 1}},
+            blocking=True,
+        )
+
+    # EvoService.SET_SYSTEM_MODE: a duration (hours) is not valid for a period mode
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN,
+            EvoService.SET_SYSTEM_MODE,
+            {"mode": "Away", "duration": {"hours": 1}},
+            blocking=True,
+        )
+
+
+@pytest.mark.parametrize("install", ["default"])
+async def test_poll_failure_keeps_entities_available(
+    hass: HomeAssistant,
+    evohome: EvohomeClient,
+) -> None:
+    """Test the entities remain available if polling the vendor's API fails."""
+
+    states = {s.entity_id: s.state for s in hass.states.async_all()}
+    assert states
+    assert STATE_UNAVAILABLE not in states.values()
+
+    with patch("evohomeasync2.location.Location.refresh_status", side_effect=KeyError):
+        await hass.data[DOMAIN]["coordinator"].async_refresh()
+        await hass.async_block_till_done()
+
+    assert not hass.data[DOMAIN]["coordinator"].last_update_success
+    assert {s.entity_id: s.state for s in hass.states.async_all()} == states
+
+
+@pytest.mark.parametrize("install", ["default"])
+async def test_update_v1_and_v2_apis(
+    hass: HomeAssistant,
+    evohome: EvohomeClient,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test polling the v2 API, and the (optional) v1 API for high-precision temps."""
+
+    broker = hass.data[DOMAIN]["broker"]
+    coordinator = hass.data[DOMAIN]["coordinator"]
+
+    zone_id = next(iter(broker.tcs.zones_by_id))
+    temps = [{"id": int(zone_id), "temp": 19.51}]
+
+    # a mocked v1 client, for the same location as the v2 client
+    broker.client_v1 = client_v1 = MagicMock()
+    client_v1.location_id = broker.loc.locationId
+    client_v1.broker.session_id = broker._sess.session_id
+    client_v1.get_temperatures = AsyncMock(return_value=temps)
+
+    # both APIs are polled successfully
+    with patch("evohomeasync2.location.Location.refresh_status") as mock_fcn:
+        await coordinator.async_refresh()
+
+    assert mock_fcn.await_count == 1
+    assert client_v1.get_temperatures.await_count == 1
+    assert coordinator.last_update_success
+    assert broker.temps == {zone_id: 19.51}
+
+    # the v1 API fails unexpectedly: the update succeeds, but the temps are reset
+    client_v1.get_temperatures.side_effect = KeyError("Boom")
+
+    with patch("evohomeasync2.location.Location.refresh_status") as mock_fcn:
+        await coordinator.async_refresh()
+
+    assert mock_fcn.await_count == 1
+    assert coordinator.last_update_success
+    assert broker.temps == {}
+    assert "Unable to obtain the latest high-precision temperatures" in caplog.text
+    assert "KeyError: 'Boom'" in caplog.text  # with the traceback
+
+    # the v2 API fails unexpectedly: the update fails
+    client_v1.get_temperatures.side_effect = None
+
+    with patch("evohomeasync2.location.Location.refresh_status", side_effect=KeyError):
+        await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert broker.temps == {zone_id: 19.51}
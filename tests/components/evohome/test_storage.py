@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 from typing import Any, Final, NotRequired, TypedDict
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -211,3 +212,42 @@ async def test_auth_tokens_diff(
         dt_util.parse_datetime(data[SZ_ACCESS_TOKEN_EXPIRES], raise_on_error=True)
         > dt_util.now()
     )
+
+
+@pytest.mark.parametrize("install", ["minimal"])
+async def test_auth_tokens_unchanged(
+    hass: HomeAssistant,
+    config: dict[str, str],
+    install: str,
+) -> None:
+    """Test saving authentication tokens only writes to the store if they changed."""
+
+    async for _ in setup_evohome(hass, config, install=install):
+        sess = hass.data[DOMAIN]["broker"]._sess
+
+        with patch.object(sess._store, "async_save") as mock_save:
+            # Confirm unchanged tokens are not saved (again) to storage...
+            await sess.save_auth_tokens()
+            assert mock_save.await_count == 0
+
+            # Confirm a changed access token is saved to storage (once)...
+            sess.client_v2.broker.access_token = f"newer_{ACCESS_TOKEN}"
+
+            await sess.save_auth_tokens()
+            assert mock_save.await_count == 1
+            assert mock_save.await_args.args[0][SZ_ACCESS_TOKEN] == (
+                f"newer_{ACCESS_TOKEN}"
+            )
+
+            await sess.save_auth_tokens()
+            assert mock_save.await_count == 1
+
+            # Confirm a changed session id is saved to storage...
+            sess.client_v1 = MagicMock()
+            sess.client_v1.broker.session_id = SESSION_ID
+
+            await sess.save_auth_tokens()
+            assert mock_save.await_count == 2
+            assert mock_save.await_args.args[0][SZ_USER_DATA] == {
+                "sessionId": SESSION_ID
+            }
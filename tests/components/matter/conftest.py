@@ -20,6 +20,16 @@ from tests.common import MockConfigEntry
 
 MOCK_FABRIC_ID = 12341234
 MOCK_COMPR_FABRIC_ID = 1234
+MOCK_SERVER_INFO = ServerInfoMessage(
+    fabric_id=MOCK_FABRIC_ID,
+    compressed_fabric_id=MOCK_COMPR_FABRIC_ID,
+    schema_version=1,
+    sdk_version="2022.11.1",
+    wifi_credentials_set=True,
+    thread_credentials_set=True,
+    min_supported_schema_version=SCHEMA_VERSION,
+    bluetooth_enabled=False,
+)
 
 
 @pytest.fixture(name="matter_client")
@@ -38,22 +48,12 @@ async def matter_client_fixture() -> AsyncGenerator[MagicMock]:
             """Mock listen."""
             if init_ready is not None:
                 init_ready.set()
-            listen_block = asyncio.Event()
-            await listen_block.wait()
+            await asyncio.get_running_loop().create_future()  # until cancelled
             pytest.fail("Listen was not cancelled!")
 
         client.connect = AsyncMock(side_effect=connect)
         client.start_listening = AsyncMock(side_effect=listen)
-        client.server_info = ServerInfoMessage(
-            fabric_id=MOCK_FABRIC_ID,
-            compressed_fabric_id=MOCK_COMPR_FABRIC_ID,
-            schema_version=1,
-            sdk_version="2022.11.1",
-            wifi_credentials_set=True,
-            thread_credentials_set=True,
-            min_supported_schema_version=SCHEMA_VERSION,
-            bluetooth_enabled=False,
-        )
+        client.server_info = MOCK_SERVER_INFO
 
         yield client
 
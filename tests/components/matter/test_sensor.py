@@ -46,80 +46,65 @@ async def test_sensor_null_value(
     assert state.state == "unknown"
 
 
-@pytest.mark.parametrize("node_fixture", ["flow_sensor"])
-async def test_flow_sensor(
-    hass: HomeAssistant,
-    matter_client: MagicMock,
-    matter_node: MatterNode,
-) -> None:
-    """Test flow sensor."""
-    state = hass.states.get("sensor.mock_flow_sensor_flow")
-    assert state
-    assert state.state == "0.0"
-
-    set_node_attribute(matter_node, 1, 1028, 0, 20)
-    await trigger_subscription_callback(hass, matter_client)
-
-    state = hass.states.get("sensor.mock_flow_sensor_flow")
-    assert state
-    assert state.state == "2.0"
-
-
-@pytest.mark.parametrize("node_fixture", ["humidity_sensor"])
-async def test_humidity_sensor(
-    hass: HomeAssistant,
-    matter_client: MagicMock,
-    matter_node: MatterNode,
-) -> None:
-    """Test humidity sensor."""
-    state = hass.states.get("sensor.mock_humidity_sensor_humidity")
-    assert state
-    assert state.state == "0.0"
-
-    set_node_attribute(matter_node, 1, 1029, 0, 4000)
-    await trigger_subscription_callback(hass, matter_client)
-
-    state = hass.states.get("sensor.mock_humidity_sensor_humidity")
-    assert state
-    assert state.state == "40.0"
-
-
-@pytest.mark.parametrize("node_fixture", ["light_sensor"])
-async def test_light_sensor(
-    hass: HomeAssistant,
-    matter_client: MagicMock,
-    matter_node: MatterNode,
-) -> None:
-    """Test light sensor."""
-    state = hass.states.get("sensor.mock_light_sensor_illuminance")
-    assert state
-    assert state.state == "1.3"
-
-    set_node_attribute(matter_node, 1, 1024, 0, 3000)
-    await trigger_subscription_callback(hass, matter_client)
-
-    state = hass.states.get("sensor.mock_light_sensor_illuminance")
-    assert state
-    assert state.state == "2.0"
-
-
-@pytest.mark.parametrize("node_fixture", ["temperature_sensor"])
-async def test_temperature_sensor(
+@pytest.mark.parametrize(
+    ("node_fixture", "entity_id", "attribute_path", "initial", "value", "expected"),
+    [
+        ("flow_sensor", "sensor.mock_flow_sensor_flow", (1, 1028, 0), "0.0", 20, "2.0"),
+        (
+            "humidity_sensor",
+            "sensor.mock_humidity_sensor_humidity",
+            (1, 1029, 0),
+            "0.0",
+            4000,
+            "40.0",
+        ),
+        (
+            "light_sensor",
+            "sensor.mock_light_sensor_illuminance",
+            (1, 1024, 0),
+            "1.3",
+            3000,
+            "2.0",
+        ),
+        (
+            "temperature_sensor",
+            "sensor.mock_temperature_sensor_temperature",
+            (1, 1026, 0),
+            "21.0",
+            2500,
+            "25.0",
+        ),
+        (
+            "pressure_sensor",
+            "sensor.mock_pressure_sensor_pressure",
+            (1, 1027, 0),
+            "0.0",
+            1010,
+            "101.0",
+        ),
+    ],
+)
+async def test_measurement_sensor(
     hass: HomeAssistant,
     matter_client: MagicMock,
     matter_node: MatterNode,
+    entity_id: str,
+    attribute_path: tuple[int, int, int],
+    initial: str,
+    value: int,
+    expected: str,
 ) -> None:
-    """Test temperature sensor."""
-    state = hass.states.get("sensor.mock_temperature_sensor_temperature")
+    """Test flow, humidity, light, temperature and pressure sensors."""
+    state = hass.states.get(entity_id)
     assert state
-    assert state.state == "21.0"
+    assert state.state == initial
 
-    set_node_attribute(matter_node, 1, 1026, 0, 2500)
+    set_node_attribute(matter_node, *attribute_path, value)
     await trigger_subscription_callback(hass, matter_client)
 
-    state = hass.states.get("sensor.mock_temperature_sensor_temperature")
+    state = hass.states.get(entity_id)
     assert state
-    assert state.state == "25.0"
+    assert state.state == expected
 
 
 @pytest.mark.parametrize("node_fixture", ["eve_contact_sensor"])
@@ -194,25 +179,6 @@ async def test_eve_thermo_sensor(
     assert state.state == "0"
 
 
-@pytest.mark.parametrize("node_fixture", ["pressure_sensor"])
-async def test_pressure_sensor(
-    hass: HomeAssistant,
-    matter_client: MagicMock,
-    matter_node: MatterNode,
-) -> None:
-    """Test pressure sensor."""
-    state = hass.states.get("sensor.mock_pressure_sensor_pressure")
-    assert state
-    assert state.state == "0.0"
-
-    set_node_attribute(matter_node, 1, 1027, 0, 1010)
-    await trigger_subscription_callback(hass, matter_client)
-
-    state = hass.states.get("sensor.mock_pressure_sensor_pressure")
-    assert state
-    assert state.state == "101.0"
-
-
 @pytest.mark.parametrize("node_fixture", ["eve_weather_sensor"])
 async def test_eve_weather_sensor_custom_cluster(
     hass: HomeAssistant,
@@ -244,45 +210,40 @@ async def test_air_quality_sensor(
     assert state
     assert state.state == "678.0"
 
-    set_node_attribute(matter_node, 1, 1037, 0, 789)
-    await trigger_subscription_callback(hass, matter_client)
-
-    state = hass.states.get("sensor.lightfi_aq1_air_quality_sensor_carbon_dioxide")
-    assert state
-    assert state.state == "789.0"
-
     # PM1
     state = hass.states.get("sensor.lightfi_aq1_air_quality_sensor_pm1")
     assert state
     assert state.state == "3.0"
 
-    set_node_attribute(matter_node, 1, 1068, 0, 50)
-    await trigger_subscription_callback(hass, matter_client)
-
-    state = hass.states.get("sensor.lightfi_aq1_air_quality_sensor_pm1")
-    assert state
-    assert state.state == "50.0"
-
     # PM2.5
     state = hass.states.get("sensor.lightfi_aq1_air_quality_sensor_pm2_5")
     assert state
     assert state.state == "3.0"
 
-    set_node_attribute(matter_node, 1, 1066, 0, 50)
-    await trigger_subscription_callback(hass, matter_client)
-
-    state = hass.states.get("sensor.lightfi_aq1_air_quality_sensor_pm2_5")
-    assert state
-    assert state.state == "50.0"
-
     # PM10
     state = hass.states.get("sensor.lightfi_aq1_air_quality_sensor_pm10")
     assert state
     assert state.state == "3.0"
 
+    # update all four attributes, then trigger a single callback
+    set_node_attribute(matter_node, 1, 1037, 0, 789)
+    set_node_attribute(matter_node, 1, 1068, 0, 50)
+    set_node_attribute(matter_node, 1, 1066, 0, 50)
     set_node_attribute(matter_node, 1, 1069, 0, 50)
     await trigger_subscription_callback(hass, matter_client)
 
+    state = hass.states.get("sensor.lightfi_aq1_air_quality_sensor_carbon_dioxide")
+    assert state
+    assert state.state == "789.0"
+
+    state = hass.states.get("sensor.lightfi_aq1_air_quality_sensor_pm1")
+    assert state
+    assert state.state == "50.0"
+
+    state = hass.states.get("sensor.lightfi_aq1_air_quality_sensor_pm2_5")
+    assert state
+    assert state.state == "50.0"
+
     state = hass.states.get("sensor.lightfi_aq1_air_quality_sensor_pm10")
     assert state
     assert state.state == "50.0"
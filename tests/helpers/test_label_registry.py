@@ -50,8 +50,6 @@ async def test_create_label(
 
     assert len(label_registry.labels) == 1
 
-    await hass.async_block_till_done()
-
     assert len(update_events) == 1
     assert update_events[0].data == {
         "action": "create",
@@ -103,8 +101,6 @@ async def test_delete_label(
 
     assert not label_registry.labels
 
-    await hass.async_block_till_done()
-
     assert len(update_events) == 2
     assert update_events[0].data == {
         "action": "create",
@@ -170,8 +166,6 @@ async def test_update_label(
     )
     assert len(label_registry.labels) == 1
 
-    await hass.async_block_till_done()
-
     assert len(update_events) == 2
     assert update_events[0].data == {
         "action": "create",